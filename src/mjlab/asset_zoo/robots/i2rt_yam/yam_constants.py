@@ -1,5 +1,7 @@
 """YAM constants."""
 
+import math
+from functools import cache
 from pathlib import Path
 
 import mujoco
@@ -24,12 +26,18 @@ YAM_XML: Path = (
 assert YAM_XML.exists()
 
 
-def get_assets(meshdir: str) -> dict[str, bytes]:
+@cache
+def _load_assets(meshdir: str) -> dict[str, bytes]:
   assets: dict[str, bytes] = {}
   update_assets(assets, YAM_XML.parent / "assets", meshdir)
   return assets
 
 
+def get_assets(meshdir: str) -> dict[str, bytes]:
+  # Mesh files are only read from disk once; each caller gets its own dict.
+  return dict(_load_assets(meshdir))
+
+
 def get_spec() -> mujoco.MjSpec:
   spec = mujoco.MjSpec.from_file(str(YAM_XML))
   spec.assets = get_assets(spec.meshdir)
@@ -56,7 +64,7 @@ DM_4310 = ElectricActuator(
   effort_limit=10.0,
 )
 
-NATURAL_FREQ = 10 * 2.0 * 3.1415926535  # 10Hz
+NATURAL_FREQ = 10 * 2.0 * math.pi  # 10Hz
 DAMPING_RATIO = 2.0
 
 STIFFNESS_DM_4340 = ARMATURE_DM_4340 * NATURAL_FREQ**2
@@ -110,7 +118,7 @@ GRIPPER_TRANSMISSION_RATIO_CRANK = (
 )
 
 # PD controller gains.
-NATURAL_FREQ_GRIPPER = 2 * 2.0 * 3.1415926535  # 2Hz
+NATURAL_FREQ_GRIPPER = 2 * 2.0 * math.pi  # 2Hz
 STIFFNESS_DM_4310_LINEAR_CRANK = ARMATURE_DM_4310_LINEAR_CRANK * NATURAL_FREQ_GRIPPER**2
 DAMPING_DM_4310_LINEAR_CRANK = (
   2.0 * DAMPING_RATIO * ARMATURE_DM_4310_LINEAR_CRANK * NATURAL_FREQ_GRIPPER
@@ -1,5 +1,7 @@
 """Unitree G1 constants."""
 
+import math
+from functools import cache
 from pathlib import Path
 
 import mujoco
@@ -24,12 +26,18 @@ G1_XML: Path = (
 assert G1_XML.exists()
 
 
-def get_assets(meshdir: str) -> dict[str, bytes]:
+@cache
+def _load_assets(meshdir: str) -> dict[str, bytes]:
   assets: dict[str, bytes] = {}
   update_assets(assets, G1_XML.parent / "assets", meshdir)
   return assets
 
 
+def get_assets(meshdir: str) -> dict[str, bytes]:
+  # Mesh files are only read from disk once; each caller gets its own dict.
+  return dict(_load_assets(meshdir))
+
+
 def get_spec() -> mujoco.MjSpec:
   spec = mujoco.MjSpec.from_file(str(G1_XML))
   spec.assets = get_assets(spec.meshdir)
@@ -118,7 +126,7 @@ ACTUATOR_4010 = ElectricActuator(
   effort_limit=5.0,
 )
 
-NATURAL_FREQ = 10 * 2.0 * 3.1415926535  # 10Hz
+NATURAL_FREQ = 10 * 2.0 * math.pi  # 10Hz
 DAMPING_RATIO = 2.0
 
 STIFFNESS_5020 = ARMATURE_5020 * NATURAL_FREQ**2
@@ -223,29 +231,31 @@ KNEES_BENT_KEYFRAME = EntityCfg.InitialStateCfg(
 # Collision config.
 ##
 
+_foot_regex = r"^(left|right)_foot[1-7]_collision$"
+
 # This enables all collisions, including self collisions.
 # Self-collisions are given condim=1 while foot collisions
 # are given condim=3.
 FULL_COLLISION = CollisionCfg(
   geom_names_expr=(".*_collision",),
-  condim={r"^(left|right)_foot[1-7]_collision$": 3, ".*_collision": 1},
-  priority={r"^(left|right)_foot[1-7]_collision$": 1},
-  friction={r"^(left|right)_foot[1-7]_collision$": (0.6,)},
+  condim={_foot_regex: 3, ".*_collision": 1},
+  priority={_foot_regex: 1},
+  friction={_foot_regex: (0.6,)},
 )
 
 FULL_COLLISION_WITHOUT_SELF = CollisionCfg(
   geom_names_expr=(".*_collision",),
   contype=0,
   conaffinity=1,
-  condim={r"^(left|right)_foot[1-7]_collision$": 3, ".*_collision": 1},
-  priority={r"^(left|right)_foot[1-7]_collision$": 1},
-  friction={r"^(left|right)_foot[1-7]_collision$": (0.6,)},
+  condim={_foot_regex: 3, ".*_collision": 1},
+  priority={_foot_regex: 1},
+  friction={_foot_regex: (0.6,)},
 )
 
 # This disables all collisions except the feet.
 # Feet get condim=3, all other geoms are disabled.
 FEET_ONLY_COLLISION = CollisionCfg(
-  geom_names_expr=(r"^(left|right)_foot[1-7]_collision$",),
+  geom_names_expr=(_foot_regex,),
   contype=0,
   conaffinity=1,
   condim=3,
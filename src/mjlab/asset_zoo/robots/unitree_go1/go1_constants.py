@@ -1,5 +1,7 @@
 """Unitree Go1 constants."""
 
+import math
+from functools import cache
 from pathlib import Path
 
 import mujoco
@@ -21,12 +23,18 @@ GO1_XML: Path = (
 assert GO1_XML.exists()
 
 
-def get_assets(meshdir: str) -> dict[str, bytes]:
+@cache
+def _load_assets(meshdir: str) -> dict[str, bytes]:
   assets: dict[str, bytes] = {}
   update_assets(assets, GO1_XML.parent / "assets", meshdir)
   return assets
 
 
+def get_assets(meshdir: str) -> dict[str, bytes]:
+  # Mesh files are only read from disk once; each caller gets its own dict.
+  return dict(_load_assets(meshdir))
+
+
 def get_spec() -> mujoco.MjSpec:
   spec = mujoco.MjSpec.from_file(str(GO1_XML))
   spec.assets = get_assets(spec.meshdir)
@@ -57,7 +65,7 @@ KNEE_ACTUATOR = ElectricActuator(
   effort_limit=35.55,
 )
 
-NATURAL_FREQ = 10 * 2.0 * 3.1415926535  # 10Hz
+NATURAL_FREQ = 10 * 2.0 * math.pi  # 10Hz
 DAMPING_RATIO = 2.0
 
 STIFFNESS_HIP = HIP_ACTUATOR.reflected_inertia * NATURAL_FREQ**2
@@ -1,5 +1,6 @@
 """Task registry system for managing environment registration and creation."""
 
+from collections.abc import Callable
 from copy import deepcopy
 from dataclasses import dataclass
 
@@ -7,10 +8,13 @@ from mjlab.envs import ManagerBasedRlEnvCfg
 from mjlab.rl import RslRlOnPolicyRunnerCfg
 
 
+EnvCfgOrFactory = ManagerBasedRlEnvCfg | Callable[[], ManagerBasedRlEnvCfg]
+
+
 @dataclass
 class _TaskCfg:
-  env_cfg: ManagerBasedRlEnvCfg
-  play_env_cfg: ManagerBasedRlEnvCfg
+  env_cfg: EnvCfgOrFactory
+  play_env_cfg: EnvCfgOrFactory
   rl_cfg: RslRlOnPolicyRunnerCfg
   runner_cls: type | None
 
@@ -21,8 +25,8 @@ _REGISTRY: dict[str, _TaskCfg] = {}
 
 def register_mjlab_task(
   task_id: str,
-  env_cfg: ManagerBasedRlEnvCfg,
-  play_env_cfg: ManagerBasedRlEnvCfg,
+  env_cfg: EnvCfgOrFactory,
+  play_env_cfg: EnvCfgOrFactory,
   rl_cfg: RslRlOnPolicyRunnerCfg,
   runner_cls: type | None = None,
 ) -> None:
@@ -30,8 +34,11 @@ def register_mjlab_task(
 
   Args:
     task_id: Unique task identifier (e.g., "Mjlab-Velocity-Rough-Unitree-Go1").
-    env_cfg: Environment configuration used for training.
-    play_env_cfg: Environment configuration in "play" mode.
+    env_cfg: Environment configuration used for training, or a zero-argument
+      callable that builds it. Callables are only invoked the first time the
+      task's config is loaded.
+    play_env_cfg: Environment configuration in "play" mode, or a zero-argument
+      callable that builds it.
     rl_cfg: RL runner configuration.
     runner_cls: Optional custom runner class. If None, uses OnPolicyRunner.
   """
@@ -48,11 +55,17 @@ def list_tasks() -> list[str]:
 def load_env_cfg(task_name: str, play: bool = False) -> ManagerBasedRlEnvCfg:
   """Load environment configuration for a task.
 
-  Returns a deep copy to prevent mutation of the registered config.
+  Configs registered as factories are built on first load and cached. Returns a
+  deep copy to prevent mutation of the registered config.
   """
-  return deepcopy(
-    _REGISTRY[task_name].env_cfg if not play else _REGISTRY[task_name].play_env_cfg
-  )
+  task = _REGISTRY[task_name]
+  if play:
+    if callable(task.play_env_cfg):
+      task.play_env_cfg = task.play_env_cfg()
+    return deepcopy(task.play_env_cfg)
+  if callable(task.env_cfg):
+    task.env_cfg = task.env_cfg()
+  return deepcopy(task.env_cfg)
 
 
 def load_rl_cfg(task_name: str) -> RslRlOnPolicyRunnerCfg:
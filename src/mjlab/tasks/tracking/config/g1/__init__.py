@@ -1,3 +1,5 @@
+from functools import partial
+
 from mjlab.tasks.registry import register_mjlab_task
 from mjlab.tasks.tracking.rl import MotionTrackingOnPolicyRunner
 
@@ -6,16 +8,18 @@ from .rl_cfg import unitree_g1_tracking_ppo_runner_cfg
 
 register_mjlab_task(
   task_id="Mjlab-Tracking-Flat-Unitree-G1",
-  env_cfg=unitree_g1_flat_tracking_env_cfg(),
-  play_env_cfg=unitree_g1_flat_tracking_env_cfg(play=True),
+  env_cfg=unitree_g1_flat_tracking_env_cfg,
+  play_env_cfg=partial(unitree_g1_flat_tracking_env_cfg, play=True),
   rl_cfg=unitree_g1_tracking_ppo_runner_cfg(),
   runner_cls=MotionTrackingOnPolicyRunner,
 )
 
 register_mjlab_task(
   task_id="Mjlab-Tracking-Flat-Unitree-G1-No-State-Estimation",
-  env_cfg=unitree_g1_flat_tracking_env_cfg(has_state_estimation=False),
-  play_env_cfg=unitree_g1_flat_tracking_env_cfg(has_state_estimation=False, play=True),
+  env_cfg=partial(unitree_g1_flat_tracking_env_cfg, has_state_estimation=False),
+  play_env_cfg=partial(
+    unitree_g1_flat_tracking_env_cfg, has_state_estimation=False, play=True
+  ),
   rl_cfg=unitree_g1_tracking_ppo_runner_cfg(),
   runner_cls=MotionTrackingOnPolicyRunner,
 )
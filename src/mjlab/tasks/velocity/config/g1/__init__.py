@@ -1,3 +1,5 @@
+from functools import partial
+
 from mjlab.tasks.registry import register_mjlab_task
 from mjlab.tasks.velocity.rl import VelocityOnPolicyRunner
 
@@ -9,16 +11,16 @@ from .rl_cfg import unitree_g1_ppo_runner_cfg
 
 register_mjlab_task(
   task_id="Mjlab-Velocity-Rough-Unitree-G1",
-  env_cfg=unitree_g1_rough_env_cfg(),
-  play_env_cfg=unitree_g1_rough_env_cfg(play=True),
+  env_cfg=unitree_g1_rough_env_cfg,
+  play_env_cfg=partial(unitree_g1_rough_env_cfg, play=True),
   rl_cfg=unitree_g1_ppo_runner_cfg(),
   runner_cls=VelocityOnPolicyRunner,
 )
 
 register_mjlab_task(
   task_id="Mjlab-Velocity-Flat-Unitree-G1",
-  env_cfg=unitree_g1_flat_env_cfg(),
-  play_env_cfg=unitree_g1_flat_env_cfg(play=True),
+  env_cfg=unitree_g1_flat_env_cfg,
+  play_env_cfg=partial(unitree_g1_flat_env_cfg, play=True),
   rl_cfg=unitree_g1_ppo_runner_cfg(),
   runner_cls=VelocityOnPolicyRunner,
 )
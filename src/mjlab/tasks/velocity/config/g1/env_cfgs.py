@@ -15,6 +15,60 @@ from mjlab.tasks.velocity.mdp import UniformVelocityCommandCfg
 from mjlab.tasks.velocity.velocity_env_cfg import make_velocity_env_cfg
 
 
+_FOOT_SITE_NAMES = ("left_foot", "right_foot")
+_FOOT_GEOM_NAMES = tuple(
+  f"{side}_foot{i}_collision" for side in ("left", "right") for i in range(1, 8)
+)
+
+# Rationale for std values:
+# - Knees/hip_pitch get the loosest std to allow natural leg bending during stride.
+# - Hip roll/yaw stay tighter to prevent excessive lateral sway and keep gait stable.
+# - Ankle roll is very tight for balance; ankle pitch looser for foot clearance.
+# - Waist roll/pitch stay tight to keep the torso upright and stable.
+# - Shoulders/elbows get moderate freedom for natural arm swing during walking.
+# - Wrists are loose (0.3) since they don't affect balance much.
+# Running values are ~1.5-2x walking values to accommodate larger motion range.
+_STD_STANDING: dict[str, float] = {".*": 0.05}
+_STD_WALKING: dict[str, float] = {
+  # Lower body.
+  r".*hip_pitch.*": 0.3,
+  r".*hip_roll.*": 0.15,
+  r".*hip_yaw.*": 0.15,
+  r".*knee.*": 0.35,
+  r".*ankle_pitch.*": 0.25,
+  r".*ankle_roll.*": 0.1,
+  # Waist.
+  r".*waist_yaw.*": 0.2,
+  r".*waist_roll.*": 0.08,
+  r".*waist_pitch.*": 0.1,
+  # Arms.
+  r".*shoulder_pitch.*": 0.15,
+  r".*shoulder_roll.*": 0.15,
+  r".*shoulder_yaw.*": 0.1,
+  r".*elbow.*": 0.15,
+  r".*wrist.*": 0.3,
+}
+_STD_RUNNING: dict[str, float] = {
+  # Lower body.
+  r".*hip_pitch.*": 0.5,
+  r".*hip_roll.*": 0.2,
+  r".*hip_yaw.*": 0.2,
+  r".*knee.*": 0.6,
+  r".*ankle_pitch.*": 0.35,
+  r".*ankle_roll.*": 0.15,
+  # Waist.
+  r".*waist_yaw.*": 0.3,
+  r".*waist_roll.*": 0.08,
+  r".*waist_pitch.*": 0.2,
+  # Arms.
+  r".*shoulder_pitch.*": 0.5,
+  r".*shoulder_roll.*": 0.2,
+  r".*shoulder_yaw.*": 0.15,
+  r".*elbow.*": 0.35,
+  r".*wrist.*": 0.3,
+}
+
+
 def unitree_g1_rough_env_cfg(play: bool = False) -> ManagerBasedRlEnvCfg:
   """Create Unitree G1 rough terrain velocity configuration."""
   cfg = make_velocity_env_cfg()
@@ -25,11 +79,6 @@ def unitree_g1_rough_env_cfg(play: bool = False) -> ManagerBasedRlEnvCfg:
 
   cfg.scene.entities = {"robot": get_g1_robot_cfg()}
 
-  site_names = ("left_foot", "right_foot")
-  geom_names = tuple(
-    f"{side}_foot{i}_collision" for side in ("left", "right") for i in range(1, 8)
-  )
-
   feet_ground_cfg = ContactSensorCfg(
     name="feet_ground_contact",
     primary=ContactMatch(
@@ -68,64 +117,20 @@ def unitree_g1_rough_env_cfg(play: bool = False) -> ManagerBasedRlEnvCfg:
 
   cfg.observations["critic"].terms["foot_height"].params[
     "asset_cfg"
-  ].site_names = site_names
+  ].site_names = _FOOT_SITE_NAMES
 
-  cfg.events["foot_friction"].params["asset_cfg"].geom_names = geom_names
+  cfg.events["foot_friction"].params["asset_cfg"].geom_names = _FOOT_GEOM_NAMES
   cfg.events["base_com"].params["asset_cfg"].body_names = ("torso_link",)
 
-  # Rationale for std values:
-  # - Knees/hip_pitch get the loosest std to allow natural leg bending during stride.
-  # - Hip roll/yaw stay tighter to prevent excessive lateral sway and keep gait stable.
-  # - Ankle roll is very tight for balance; ankle pitch looser for foot clearance.
-  # - Waist roll/pitch stay tight to keep the torso upright and stable.
-  # - Shoulders/elbows get moderate freedom for natural arm swing during walking.
-  # - Wrists are loose (0.3) since they don't affect balance much.
-  # Running values are ~1.5-2x walking values to accommodate larger motion range.
-  cfg.rewards["pose"].params["std_standing"] = {".*": 0.05}
-  cfg.rewards["pose"].params["std_walking"] = {
-    # Lower body.
-    r".*hip_pitch.*": 0.3,
-    r".*hip_roll.*": 0.15,
-    r".*hip_yaw.*": 0.15,
-    r".*knee.*": 0.35,
-    r".*ankle_pitch.*": 0.25,
-    r".*ankle_roll.*": 0.1,
-    # Waist.
-    r".*waist_yaw.*": 0.2,
-    r".*waist_roll.*": 0.08,
-    r".*waist_pitch.*": 0.1,
-    # Arms.
-    r".*shoulder_pitch.*": 0.15,
-    r".*shoulder_roll.*": 0.15,
-    r".*shoulder_yaw.*": 0.1,
-    r".*elbow.*": 0.15,
-    r".*wrist.*": 0.3,
-  }
-  cfg.rewards["pose"].params["std_running"] = {
-    # Lower body.
-    r".*hip_pitch.*": 0.5,
-    r".*hip_roll.*": 0.2,
-    r".*hip_yaw.*": 0.2,
-    r".*knee.*": 0.6,
-    r".*ankle_pitch.*": 0.35,
-    r".*ankle_roll.*": 0.15,
-    # Waist.
-    r".*waist_yaw.*": 0.3,
-    r".*waist_roll.*": 0.08,
-    r".*waist_pitch.*": 0.2,
-    # Arms.
-    r".*shoulder_pitch.*": 0.5,
-    r".*shoulder_roll.*": 0.2,
-    r".*shoulder_yaw.*": 0.15,
-    r".*elbow.*": 0.35,
-    r".*wrist.*": 0.3,
-  }
+  cfg.rewards["pose"].params["std_standing"] = dict(_STD_STANDING)
+  cfg.rewards["pose"].params["std_walking"] = dict(_STD_WALKING)
+  cfg.rewards["pose"].params["std_running"] = dict(_STD_RUNNING)
 
   cfg.rewards["upright"].params["asset_cfg"].body_names = ("torso_link",)
   cfg.rewards["body_ang_vel"].params["asset_cfg"].body_names = ("torso_link",)
 
-  for reward_name in ["foot_clearance", "foot_swing_height", "foot_slip"]:
-    cfg.rewards[reward_name].params["asset_cfg"].site_names = site_names
+  for reward_name in ("foot_clearance", "foot_swing_height", "foot_slip"):
+    cfg.rewards[reward_name].params["asset_cfg"].site_names = _FOOT_SITE_NAMES
 
   cfg.rewards["body_ang_vel"].weight = -0.05
   cfg.rewards["angular_momentum"].weight = -0.02
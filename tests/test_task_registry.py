@@ -0,0 +1,47 @@
+"""Tests for the task registry."""
+
+import pytest
+
+from mjlab.rl import RslRlOnPolicyRunnerCfg
+from mjlab.tasks import registry
+from mjlab.tasks.registry import load_env_cfg, register_mjlab_task
+from mjlab.tasks.velocity.config.go1.env_cfgs import unitree_go1_flat_env_cfg
+
+_TASK_ID = "Mjlab-Test-Lazy-Registration"
+
+
+@pytest.fixture
+def lazy_task():
+  calls = {"train": 0, "play": 0}
+
+  def env_cfg_fn():
+    calls["train"] += 1
+    return unitree_go1_flat_env_cfg()
+
+  def play_env_cfg_fn():
+    calls["play"] += 1
+    return unitree_go1_flat_env_cfg(play=True)
+
+  register_mjlab_task(
+    task_id=_TASK_ID,
+    env_cfg=env_cfg_fn,
+    play_env_cfg=play_env_cfg_fn,
+    rl_cfg=RslRlOnPolicyRunnerCfg(),
+  )
+  yield calls
+  registry._REGISTRY.pop(_TASK_ID)
+
+
+def test_env_cfg_factory_is_built_lazily_once(lazy_task):
+  """Factories should run on first load only, and each load returns a copy."""
+  assert lazy_task == {"train": 0, "play": 0}
+
+  cfg_a = load_env_cfg(_TASK_ID)
+  cfg_b = load_env_cfg(_TASK_ID)
+  assert lazy_task == {"train": 1, "play": 0}
+  assert cfg_a is not cfg_b
+
+  play_cfg = load_env_cfg(_TASK_ID, play=True)
+  load_env_cfg(_TASK_ID, play=True)
+  assert lazy_task == {"train": 1, "play": 1}
+  assert play_cfg.episode_length_s >= 1e9